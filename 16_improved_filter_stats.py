@@ -925,11 +925,9 @@ class PCAPViewer:
         if position + 4 <= len(hex_data):
             header_hex = hex_data[position:position+4]
             
-            # バイトの順序を入れ替え（リトルエンディアン→ビッグエンディアン）
-            header_hex_swapped = header_hex[2:4] + header_hex[0:2]
-            
-            # 2進数に変換して各フィールドを抽出
-            header_bin = bin(int(header_hex_swapped, 16))[2:].zfill(16)
+            # バイトの順序を入れ替え（リトルエンディアン→ビッグエンディアン）、1回だけ数値化
+            header = int(header_hex[2:4] + header_hex[0:2], 16)
+            header_bin = format(header, '016b')
             
             # Type (4ビット)
             result['EtherCAT_Header']['Type'] = header_bin[0:4]
@@ -938,9 +936,10 @@ class PCAPViewer:
             result['EtherCAT_Header']['Reserved'] = header_bin[4:8]
             
             # Length (8ビット)
+            length = header & 0xFF
             result['EtherCAT_Header']['Length_bin'] = header_bin[8:16]
-            result['EtherCAT_Header']['Length_hex'] = hex(int(header_bin[8:16], 2))[2:].zfill(2)
-            result['EtherCAT_Header']['Length_dec'] = int(header_bin[8:16], 2)
+            result['EtherCAT_Header']['Length_hex'] = format(length, '02x')
+            result['EtherCAT_Header']['Length_dec'] = length
             
             position += 4  # 2バイト(4文字)進める
             
@@ -999,8 +998,9 @@ class PCAPViewer:
                 length_hex = hex_data[position:position+4]
                 length_hex_swapped = length_hex[2:4] + length_hex[0:2]
                 datagram['Length_hex'] = length_hex_swapped
-                # 2進数に変換
-                length_bin = bin(int(length_hex_swapped, 16))[2:].zfill(16)
+                # 1回だけ数値化し、2進数文字列も1回だけ作成して切り出す
+                length_word = int(length_hex_swapped, 16)
+                length_bin = format(length_word, '016b')
                 # Last indicator (1ビット)
                 datagram['LastIndicator'] = length_bin[0:1]
                 # Round trip (1ビット)
@@ -1008,9 +1008,8 @@ class PCAPViewer:
                 # Reserved (3ビット)
                 datagram['Reserved'] = length_bin[2:5]
                 # Data Length (11ビット)
-                data_length_bin = length_bin[5:16]
-                datagram['DataLength_bin'] = data_length_bin
-                datagram['DataLength_dec'] = int(data_length_bin, 2)
+                datagram['DataLength_bin'] = length_bin[5:16]
+                datagram['DataLength_dec'] = length_word & 0x07FF
                 position += 4
             else:
                 break
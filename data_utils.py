@@ -205,14 +205,14 @@ class EtherCATParser:
             # Ethernet ヘッダー (14バイト) をスキップ
             position = 28  # 宛先MAC(12) + 送信元MAC(12) + Type(4) = 28桁の16進数
             
-            # EtherCAT Frame Header (2バイト) を解析
+            # EtherCAT Frame Header (2バイト) を解析（ヘッダーが欠けたフレームは解析しない）
+            if position + 4 > len(hex_data):
+                return {}
             header_hex = hex_data[position:position+4]
             
-            # 2バイトを入れ替え
-            header_hex_swapped = header_hex[2:4] + header_hex[0:2]
-            
-            # 16進数を2進数に変換
-            header_bin = bin(int(header_hex_swapped, 16))[2:].zfill(16)
+            # 2バイトを入れ替えて1回だけ数値化し、表示用の2進数文字列も1回だけ作成
+            header = int(header_hex[2:4] + header_hex[0:2], 16)
+            header_bin = format(header, '016b')
             
             # Type (4ビット)
             result['EtherCAT_Header']['Type'] = header_bin[:4]
@@ -221,10 +221,10 @@ class EtherCATParser:
             result['EtherCAT_Header']['Reserved'] = header_bin[4:5]
             
             # Length (11ビット)
-            length_bin = header_bin[5:16]
-            result['EtherCAT_Header']['Length_bin'] = length_bin
-            result['EtherCAT_Header']['Length_hex'] = hex(int(length_bin, 2))[2:].upper()
-            result['EtherCAT_Header']['Length_dec'] = int(length_bin, 2)
+            length = header & 0x07FF
+            result['EtherCAT_Header']['Length_bin'] = header_bin[5:16]
+            result['EtherCAT_Header']['Length_hex'] = format(length, 'X')
+            result['EtherCAT_Header']['Length_dec'] = length
             position += 4  # EtherCAT Frame Header (4桁の16進数)
             
             # 全体の長さ
@@ -232,20 +232,25 @@ class EtherCATParser:
             end_position = position + total_length
             
             # EtherCAT Datagramsの解析
-            datagram_count = 0
-            while position < end_position:
-                datagram_count += 1
-                datagram = {}
-                
-                # 各フィールドを順次解析
-                if not EtherCATParser._parse_datagram_fields(hex_data, position, datagram):
-                    break
-                
-                # データグラムリストに追加
+            # 先頭データグラム（大半のフレームはデータグラム1つのみ）
+            datagram = {}
+            if position < end_position and EtherCATParser._parse_datagram_fields(hex_data, position, datagram):
                 result['EtherCAT_Datagrams'].append(datagram)
-                
-                # 次のデータグラムの位置を計算
                 position = EtherCATParser._calculate_next_position(position, datagram)
+                
+                # 2つ目以降のデータグラム（複数データグラムのフレームのみ）
+                while position < end_position:
+                    datagram = {}
+                    
+                    # 各フィールドを順次解析
+                    if not EtherCATParser._parse_datagram_fields(hex_data, position, datagram):
+                        break
+                    
+                    # データグラムリストに追加
+                    result['EtherCAT_Datagrams'].append(datagram)
+                    
+                    # 次のデータグラムの位置を計算
+                    position = EtherCATParser._calculate_next_position(position, datagram)
             
             # 残りはPad bytesとして扱う
             if position < len(hex_data) and position < end_position:
@@ -278,77 +283,56 @@ class EtherCATParser:
             解析成功の場合True
         """
         try:
-            # Cmd (1バイト)
-            if position + 2 <= len(hex_data):
-                datagram['Cmd'] = hex_data[position:position+2]
-                position += 2
-            else:
+            # データグラムヘッダー（10バイト）: Cmd, Index, LogAddr, Length, Interrupt
+            if position + 20 > len(hex_data):
                 return False
+            # Length (2バイト) - バイトの順序を入れ替えて1回だけ数値化
+            length_hex = hex_data[position+12:position+16]
+            length_hex_swapped = length_hex[2:4] + length_hex[0:2]
+            length_word = int(length_hex_swapped, 16)
             
-            # Index (1バイト)
-            if position + 2 <= len(hex_data):
-                datagram['Index'] = hex_data[position:position+2]
-                position += 2
-            else:
+            # Data (可変長) と Working Counter (2バイト) が収まるか確認
+            data_length = length_word & 0x07FF
+            data_end = position + 20 + (data_length * 2)
+            if data_end + 4 > len(hex_data):
                 return False
             
+            # Cmd (1バイト)
+            datagram['Cmd'] = hex_data[position:position+2]
+            
+            # Index (1バイト)
+            datagram['Index'] = hex_data[position+2:position+4]
+            
             # Log Addr (4バイト) - バイトの順序を入れ替え
-            if position + 8 <= len(hex_data):
-                log_addr = hex_data[position:position+8]
-                datagram['LogAddr'] = log_addr[6:8] + log_addr[4:6] + log_addr[2:4] + log_addr[0:2]
-                # ADPとADOの分離（上位4桁と下位4桁）
-                adp = datagram['LogAddr'][:4]  # 上位4桁
-                ado = datagram['LogAddr'][4:]  # 下位4桁
-                datagram['ADP'] = adp  # Address Position
-                datagram['ADO'] = ado  # Address Offset
-                position += 8
-            else:
-                return False
+            log_addr = hex_data[position+4:position+12]
+            datagram['LogAddr'] = log_addr[6:8] + log_addr[4:6] + log_addr[2:4] + log_addr[0:2]
+            # ADPとADOの分離（上位4桁と下位4桁）
+            datagram['ADP'] = datagram['LogAddr'][:4]  # Address Position
+            datagram['ADO'] = datagram['LogAddr'][4:]  # Address Offset
             
-            # Length (2バイト) - バイトの順序を入れ替え
-            if position + 4 <= len(hex_data):
-                length_hex = hex_data[position:position+4]
-                length_hex_swapped = length_hex[2:4] + length_hex[0:2]
-                datagram['Length_hex'] = length_hex_swapped
-                # 2進数に変換
-                length_bin = bin(int(length_hex_swapped, 16))[2:].zfill(16)
-                # Last indicator (1ビット)
-                datagram['LastIndicator'] = length_bin[0:1]
-                # Round trip (1ビット)
-                datagram['RoundTrip'] = length_bin[1:2]
-                # Reserved (3ビット)
-                datagram['Reserved'] = length_bin[2:5]
-                # Data Length (11ビット)
-                data_length_bin = length_bin[5:16]
-                datagram['DataLength_bin'] = data_length_bin
-                datagram['DataLength_dec'] = int(data_length_bin, 2)
-                position += 4
-            else:
-                return False
+            # Length (2バイト) - 表示用の2進数文字列は1回だけ作成して切り出す
+            datagram['Length_hex'] = length_hex_swapped
+            length_bin = format(length_word, '016b')
+            # Last indicator (1ビット)
+            datagram['LastIndicator'] = length_bin[0:1]
+            # Round trip (1ビット)
+            datagram['RoundTrip'] = length_bin[1:2]
+            # Reserved (3ビット)
+            datagram['Reserved'] = length_bin[2:5]
+            # Data Length (11ビット)
+            datagram['DataLength_bin'] = length_bin[5:16]
+            datagram['DataLength_dec'] = data_length
             
             # Interrupt (2バイト) - バイトの順序を入れ替え
-            if position + 4 <= len(hex_data):
-                interrupt_hex = hex_data[position:position+4]
-                datagram['Interrupt'] = interrupt_hex[2:4] + interrupt_hex[0:2]
-                position += 4
-            else:
-                return False
+            interrupt_hex = hex_data[position+16:position+20]
+            datagram['Interrupt'] = interrupt_hex[2:4] + interrupt_hex[0:2]
             
             # Data (可変長)
-            data_length = datagram['DataLength_dec']
-            if position + (data_length * 2) <= len(hex_data):
-                datagram['Data'] = hex_data[position:position+(data_length*2)]
-                position += (data_length * 2)
-            else:
-                return False
+            datagram['Data'] = hex_data[position+20:data_end]
             
             # Working Counter (2バイト) - バイトの順序を入れ替え
-            if position + 4 <= len(hex_data):
-                wkc_hex = hex_data[position:position+4]
-                datagram['WorkingCnt'] = wkc_hex[2:4] + wkc_hex[0:2]
-                position += 4
-            else:
-                return False
+            wkc_hex = hex_data[data_end:data_end+4]
+            datagram['WorkingCnt'] = wkc_hex[2:4] + wkc_hex[0:2]
             
             return True
             
@@ -383,11 +367,17 @@ def hex_to_decimal(hex_str):
     return 0
 
 def hex_to_binary(hex_str):
-    """16進数文字列を2進数文字列に変換"""
+    """16進数文字列を2進数文字列に変換（表示用）"""
     if isinstance(hex_str, str):
         hex_str = hex_str.replace('0x', '')
         try:
-            return bin(int(hex_str, 16))[2:].zfill(len(hex_str) * 4)
+            return format(int(hex_str, 16), f'0{len(hex_str) * 4}b')
         except ValueError:
             return '0'
-    return '0'
\ No newline at end of file
+    return '0'
+
+def hex_to_int_le(hex_str: str) -> int:
+    """リトルエンディアンの16進数バイト列を整数に変換（空文字列はValueError）"""
+    if not hex_str:
+        raise ValueError("空の16進数文字列は変換できません")
+    return int.from_bytes(bytes.fromhex(hex_str), 'little')
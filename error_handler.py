@@ -2,10 +2,27 @@
 """
 エラーハンドリング用モジュール
 """
+import atexit
 import logging
-import traceback
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional, Callable
 
+# ファイル/コンソール出力を担うバックグラウンドリスナー（プロセスで1つ）
+_log_listener: Optional[QueueListener] = None
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """レコードを整形せずにキューへ渡すハンドラ
+    
+    標準のQueueHandlerはprepare()で呼び出し元スレッドでメッセージと
+    トレースバックを整形してしまう。キューは同一プロセス内なので
+    レコードをそのまま渡し、整形はリスナー側のハンドラで行う。
+    """
+    
+    def prepare(self, record):
+        return record
+
 
 class ErrorHandler:
     """エラーハンドリングを統一するクラス"""
@@ -19,15 +36,29 @@ class ErrorHandler:
         self.setup_logging()
     
     def setup_logging(self):
-        """ログ設定を初期化"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('pcap_viewer.log', encoding='utf-8'),
-                logging.StreamHandler()
-            ]
-        )
+        """
+        ログ設定を初期化
+        
+        ログはキュー経由でバックグラウンドスレッドに渡し、
+        ファイル書き込みで呼び出し元（GUIスレッド）をブロックしない
+        """
+        global _log_listener
+        if _log_listener is None:
+            log_queue = queue.Queue(-1)
+            logging.basicConfig(
+                level=logging.INFO,
+                handlers=[_DeferredQueueHandler(log_queue)]
+            )
+            
+            # 整形（トレースバック含む）はリスナースレッドのハンドラで行う
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            file_handler = logging.FileHandler('pcap_viewer.log', encoding='utf-8')
+            file_handler.setFormatter(formatter)
+            stream_handler = logging.StreamHandler()
+            stream_handler.setFormatter(formatter)
+            _log_listener = QueueListener(log_queue, file_handler, stream_handler)
+            _log_listener.start()
+            atexit.register(_log_listener.stop)
         self.logger = logging.getLogger(__name__)
     
     def handle_exception(self, e: Exception, context: str = "", user_message: str = "") -> None:
@@ -39,9 +70,8 @@ class ErrorHandler:
             context: エラーが発生したコンテキスト
             user_message: ユーザーに表示するメッセージ
         """
-        # ログに詳細を記録
-        error_details = f"{context}: {str(e)}\n{traceback.format_exc()}"
-        self.logger.error(error_details)
+        # ログに詳細を記録（トレースバックの整形はリスナースレッドのハンドラで行う）
+        self.logger.error("%s: %s", context, e, exc_info=e)
         
         # ユーザーにフレンドリーなメッセージを表示
         if user_message:
@@ -52,7 +82,7 @@ class ErrorHandler:
         if self.status_callback:
             self.status_callback(display_message)
         
-        print(f"エラー詳細: {error_details}")  # デバッグ用
+        print(f"エラー詳細: {context}: {type(e).__name__}: {e}")  # デバッグ用
     
     def safe_execute(self, func: Callable, *args, context: str = "", user_message: str = "", **kwargs):
         """
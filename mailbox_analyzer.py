@@ -6,10 +6,39 @@ EtherCATのメールボックス通信（CoE、FoE、EoE、SoE）を解析
 import tkinter as tk
 from tkinter import ttk, Frame, Label, Button, Toplevel, Scrollbar, VERTICAL, HORIZONTAL, END, Text, NORMAL, DISABLED
 from collections import defaultdict, Counter, OrderedDict
+import matplotlib
+# 図はすべてFigureCanvasTkAggに埋め込むため、pyplot側は非対話のAggで十分
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.collections import LineCollection
+import numpy as np
+import pandas as pd
 from typing import Dict, List, Tuple, Any, Optional
 import struct
+from performance_utils import BackgroundProcessor
+
+
+# メールボックス通信に使われるコマンド（FPRD/FPWR/FPRW）
+_MB_CMDS = frozenset(('0c', '0d', '0e'))
+
+# 読み込み系コマンド（FPRD/FPRW）
+_READ_CMDS = frozenset(('0c', '0e'))
+
+# エラーとして扱うSDOコマンドの接頭辞
+_ABORT_PREFIXES = ('SDO Abort',)
+
+# バックグラウンド抽出の完了確認間隔（ミリ秒）
+_EXTRACT_POLL_MS = 50
+
+# 通信情報に保持するメールボックスデータ先頭部分の長さ（16進文字数、24バイト分）
+_DATA_HEAD_NIBBLES = 48
+
+# ツリービューに一度に追加する行数
+_TREE_PAGE_SIZE = 500
+
+# 埋め込み図の解像度（Tkウィジェットのサイズに収まる範囲で低めに設定）
+_FIGURE_DPI = 72
 
 
 class MailboxAnalyzer:
@@ -35,12 +64,44 @@ class MailboxAnalyzer:
         0x80: "SDO Abort Transfer"
     }
     
+    # シーケンス図のプロトコル別の色
+    _SEQ_COLOR_MAP = {
+        0x01: 'blue',   # CoE
+        0x02: 'green',  # EoE
+        0x03: 'orange', # FoE
+        0x04: 'red',    # SoE
+        0x05: 'purple'  # VoE
+    }
+    
+    # タブ名と構築メソッド（タブを初めて表示したときに構築）
+    _TABS = (
+        ("概要", 'create_overview_tab'),
+        ("CoE解析", 'create_coe_analysis_tab'),
+        ("通信シーケンス", 'create_mailbox_sequence_tab'),
+        ("オブジェクトディクショナリ", 'create_object_dictionary_tab'),
+        ("エラー解析", 'create_mailbox_errors_tab'),
+        ("統計", 'create_statistics_tab')
+    )
+    
     def __init__(self, parent, data: List[Dict], board_parser=None):
         self.parent = parent
         self.data = data
         self.board_parser = board_parser
         self.window = None
         self.mailbox_data = []
+        self.df = pd.DataFrame()
+        self._pairs_cache = None
+        self._node_name_cache = {}
+        self._stats_canvas = None
+        self._stats_bars = []
+        self._stats_bg = []
+        self.notebook = None
+        self._tab_frames = []
+        self._built_tabs = set()
+        self._extracted = False
+        self._extract_error = None
+        # 実行中の抽出スレッド（ウィンドウを開き直しても二重に開始しない）
+        self._extract_thread = None
         
     def show(self):
         """メールボックス解析ウィンドウを表示"""
@@ -52,53 +113,113 @@ class MailboxAnalyzer:
         self.window.title("メールボックス通信解析")
         self.window.geometry("1400x900")
         
-        # メールボックス通信を抽出
-        self.extract_mailbox_communications()
+        # ノートブックと空のタブを先に作成して即座に表示
+        self.notebook = ttk.Notebook(self.window)
+        self.notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        self._tab_frames = []
+        self._built_tabs = set()
+        self._extracted = False
+        for title, _ in self._TABS:
+            tab = Frame(self.notebook)
+            self.notebook.add(tab, text=title)
+            Label(tab, text="メールボックス通信を解析中...").pack(pady=20)
+            self._tab_frames.append(tab)
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        
+        # メールボックス通信の抽出はワーカースレッドで実行
+        # 前回開いたウィンドウの抽出がまだ実行中なら、新たに開始せずその完了を待つ
+        if self._extract_thread is None or not self._extract_thread.is_alive():
+            self._extract_error = None
+            processor = BackgroundProcessor(self._on_extract_progress)
+            self._extract_thread = processor.process_in_background(self.extract_mailbox_communications)
+        self.window.after(_EXTRACT_POLL_MS, self._wait_for_extraction, self._extract_thread, self.window)
+        
+    def _on_extract_progress(self, percent, message):
+        """抽出処理の進捗通知（ワーカースレッドから呼ばれるためTkには触れない）"""
+        if percent < 0:
+            self._extract_error = message
+            
+    def _wait_for_extraction(self, thread, window):
+        """抽出完了をTkのメインスレッドで待ち、表示中のタブを構築
+        
+        Args:
+            thread: 抽出を実行中のスレッド
+            window: 待機を開始したウィンドウ（閉じられた・開き直された場合は待機を終了）
+        """
+        if window is not self.window or not window.winfo_exists():
+            return
+        if thread.is_alive():
+            window.after(_EXTRACT_POLL_MS, self._wait_for_extraction, thread, window)
+            return
+            
+        self._extracted = True
+        if self._extract_error:
+            for tab in self._tab_frames:
+                for child in tab.winfo_children():
+                    child.destroy()
+                Label(tab, text=f"メールボックス通信の解析に失敗しました\n{self._extract_error}").pack(pady=20)
+            return
+        self._build_current_tab()
         
-        # ノートブックでタブを作成
-        notebook = ttk.Notebook(self.window)
-        notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+    def _on_tab_changed(self, event):
+        """タブ切り替え時に未構築のタブを構築"""
+        if self._extracted and not self._extract_error:
+            self.window.after_idle(self._build_current_tab)
+            
+    def _build_current_tab(self):
+        """選択中のタブを初回のみ構築"""
+        index = self.notebook.index('current')
+        if index in self._built_tabs:
+            return
+        self._built_tabs.add(index)
         
-        # 各タブを追加
-        self.create_overview_tab(notebook)
-        self.create_coe_analysis_tab(notebook)
-        self.create_mailbox_sequence_tab(notebook)
-        self.create_object_dictionary_tab(notebook)
-        self.create_mailbox_errors_tab(notebook)
-        self.create_statistics_tab(notebook)
+        tab = self._tab_frames[index]
+        for child in tab.winfo_children():
+            child.destroy()
+        getattr(self, self._TABS[index][1])(tab)
         
     def extract_mailbox_communications(self):
         """データからメールボックス通信を抽出"""
-        self.mailbox_data = []
-        
-        for packet in self.data:
+        self.mailbox_data = self._collect_mailbox_data()
+        
+        # 集計用に列指向のDataFrameを1回だけ構築
+        self.df = pd.DataFrame(self.mailbox_data)
+        self._pairs_cache = None
+        self._node_name_cache = {}
+        
+    def _node_name(self, logaddr):
+        """LogAddrからノード名を取得（LogAddr単位でキャッシュ）"""
+        node_name = self._node_name_cache.get(logaddr)
+        if node_name is None:
+            board_name = self.board_parser.get_board_name(logaddr) if self.board_parser else None
+            node_name = board_name if board_name else f"0x{logaddr}"
+            self._node_name_cache[logaddr] = node_name
+        return node_name
+        
+    def _collect_mailbox_data(self):
+        """全データグラムからメールボックス通信の情報を収集"""
+        mailbox_data = []
+        
+        for packet_idx, packet in enumerate(self.data):
             if packet.get('EtherCAT') and 'EtherCAT_Datagrams' in packet['EtherCAT']:
-                for datagram in packet['EtherCAT']['EtherCAT_Datagrams']:
-                    # メールボックス通信の特徴を検出
-                    # 通常、特定のLogAddrレンジやデータパターンで識別
-                    if self.is_mailbox_communication(datagram):
-                        mailbox_info = self.parse_mailbox_data(datagram, packet)
+                for dgram_idx, datagram in enumerate(packet['EtherCAT']['EtherCAT_Datagrams']):
+                    # FPRD/FPWR/FPRWコマンドで、データ長が8バイト以上のものがメールボックス通信
+                    if datagram.get('Cmd', '') in _MB_CMDS and datagram.get('DataLength_dec', 0) >= 8:
+                        mailbox_info = self.parse_mailbox_data(datagram, packet, (packet_idx, dgram_idx))
                         if mailbox_info:
-                            self.mailbox_data.append(mailbox_info)
+                            mailbox_data.append(mailbox_info)
                             
-    def is_mailbox_communication(self, datagram):
-        """データグラムがメールボックス通信かどうか判定"""
-        # メールボックス通信の判定基準
-        # 1. データ長が一定以上（通常8バイト以上）
-        # 2. 特定のコマンドタイプ（FPRD/FPWR/FPRW）
-        # 3. 特定のアドレスレンジ
-        
-        cmd = datagram.get('Cmd', '')
-        data_length = datagram.get('DataLength_dec', 0)
+        return mailbox_data
         
-        # FPRDまたはFPWRコマンドで、データ長が8バイト以上
-        if cmd in ['0c', '0d', '0e'] and data_length >= 8:
-            return True
-            
-        return False
+    def parse_mailbox_data(self, datagram, packet, source=None):
+        """メールボックスデータを解析
         
-    def parse_mailbox_data(self, datagram, packet):
-        """メールボックスデータを解析"""
+        Args:
+            datagram: 解析対象のデータグラム
+            packet: データグラムを含むパケット
+            source: self.data内の位置 (パケット番号, データグラム番号)
+        """
         data = datagram.get('Data', '')
         if len(data) < 16:  # 最小8バイト
             return None
@@ -106,79 +227,112 @@ class MailboxAnalyzer:
         try:
             # メールボックスヘッダーの解析（最初の6バイト）
             # Length (2bytes), Address (2bytes), Priority:Type (1byte), Count (1byte)
-            mb_length = int(data[0:4], 16)  # リトルエンディアン
-            mb_address = int(data[4:8], 16)
-            mb_type_priority = int(data[8:10], 16)
-            mb_count = int(data[10:12], 16)
+            raw = bytes.fromhex(data[:12])
+            mb_length = int.from_bytes(raw[0:2], 'little')
+            mb_address = int.from_bytes(raw[2:4], 'little')
+            mb_type_priority = raw[4]
+            mb_count = raw[5]
             
             mb_type = mb_type_priority & 0x0F
             mb_priority = (mb_type_priority >> 4) & 0x0F
             
-            mailbox_info = {
-                'packet_no': packet['No'],
-                'time': packet['Time'],
-                'timestamp': packet.get('Timestamp', 0),
-                'src': packet.get('Source', ''),
-                'dst': packet.get('Destination', ''),
-                'logaddr': datagram.get('LogAddr', ''),
-                'cmd': datagram.get('Cmd', ''),
-                'mb_length': mb_length,
-                'mb_address': mb_address,
-                'mb_type': mb_type,
-                'mb_priority': mb_priority,
-                'mb_count': mb_count,
-                'mb_protocol': self.MAILBOX_PROTOCOLS.get(mb_type, f"Unknown({mb_type})"),
-                'data': data[12:],  # メールボックスヘッダー以降のデータ
-                'raw_data': data
-            }
-            
-            # プロトコル別の追加解析
-            if mb_type == 0x01:  # CoE
-                self.parse_coe_data(mailbox_info)
-                
-            return mailbox_info
+            return self.build_mailbox_info(
+                datagram, packet, source, mb_length, mb_address, mb_type, mb_priority, mb_count)
             
         except Exception as e:
             print(f"メールボックスデータ解析エラー: {e}")
             return None
             
+    def build_mailbox_info(self, datagram, packet, source, mb_length, mb_address, mb_type, mb_priority, mb_count):
+        """解析済みのメールボックスヘッダーから通信情報の辞書を作成"""
+        data = datagram.get('Data', '')
+        mailbox_info = {
+            'packet_no': packet['No'],
+            'time': packet['Time'],
+            'timestamp': packet.get('Timestamp', 0),
+            'src': packet.get('Source', ''),
+            'dst': packet.get('Destination', ''),
+            'logaddr': datagram.get('LogAddr', ''),
+            'cmd': datagram.get('Cmd', ''),
+            'mb_length': mb_length,
+            'mb_address': mb_address,
+            'mb_type': mb_type,
+            'mb_priority': mb_priority,
+            'mb_count': mb_count,
+            'mb_protocol': self.MAILBOX_PROTOCOLS.get(mb_type, f"Unknown({mb_type})"),
+            # ペイロード全体は保持せず、先頭部分と元データグラムへの参照のみ保持
+            'data_head': data[12:12 + _DATA_HEAD_NIBBLES],
+            'data_len_nib': len(data) - 12,
+            'source': source
+        }
+        
+        # プロトコル別の追加解析
+        if mb_type == 0x01:  # CoE
+            self.parse_coe_data(mailbox_info)
+            
+        # シーケンス図用の短いラベル
+        if 'sdo_command' in mailbox_info:
+            mailbox_info['label'] = mailbox_info['sdo_command'].split()[0]
+        else:
+            mailbox_info['label'] = mailbox_info['mb_protocol'].split()[0]
+            
+        return mailbox_info
+            
+    def full_data(self, mb):
+        """メールボックスヘッダー以降のデータ全体を元のデータグラムから取得
+        
+        Args:
+            mb: extract_mailbox_communicationsで作成した通信情報
+            
+        Returns:
+            str: 16進文字列のデータ（参照元がない場合は先頭部分のみ）
+        """
+        if mb.get('source') is None:
+            return mb['data_head']
+        packet_idx, dgram_idx = mb['source']
+        datagram = self.data[packet_idx]['EtherCAT']['EtherCAT_Datagrams'][dgram_idx]
+        return datagram.get('Data', '')[12:]
+        
     def parse_coe_data(self, mailbox_info):
-        """CoEデータを解析"""
-        data = mailbox_info['data']
+        """CoEデータを解析
+        
+        sdo_dataはdata_headの範囲に収まる先頭部分のみ保持する。
+        全体が必要な場合はfull_data()で元のデータグラムから取得する。
+        """
+        data = mailbox_info['data_head']
         if len(data) < 8:
             return
             
         try:
-            # CoEヘッダー（2バイト）
-            coe_header = int(data[0:4], 16)
+            coe_raw = bytes.fromhex(data[:12])
+            
+            # CoEヘッダー（2バイト、リトルエンディアン）
+            coe_header = int.from_bytes(coe_raw[0:2], 'little')
             service = (coe_header >> 12) & 0x0F
             
             mailbox_info['coe_service'] = service
             
             if service == 2:  # SDO Service
                 # SDO Command Specifier
-                sdo_cs = int(data[4:6], 16)
+                sdo_cs = coe_raw[2]
                 mailbox_info['sdo_command'] = self.COE_SDO_COMMANDS.get(sdo_cs & 0xE0, f"Unknown(0x{sdo_cs:02x})")
                 
                 # Index and Subindex
-                if len(data) >= 12:
-                    index = int(data[8:10] + data[6:8], 16)  # リトルエンディアン
-                    subindex = int(data[10:12], 16)
+                if len(coe_raw) >= 6:
+                    index = int.from_bytes(coe_raw[3:5], 'little')
+                    subindex = coe_raw[5]
                     mailbox_info['sdo_index'] = f"0x{index:04X}"
                     mailbox_info['sdo_subindex'] = f"0x{subindex:02X}"
                     
-                    # SDOデータ
+                    # SDOデータ（先頭部分のみ）
                     if len(data) > 12:
                         mailbox_info['sdo_data'] = data[12:]
                         
         except Exception as e:
             print(f"CoEデータ解析エラー: {e}")
             
-    def create_overview_tab(self, notebook):
+    def create_overview_tab(self, tab):
         """概要タブを作成"""
-        tab = Frame(notebook)
-        notebook.add(tab, text="概要")
-        
         # テキストエリア
         text_frame = Frame(tab)
         text_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -197,41 +351,26 @@ class MailboxAnalyzer:
         text_widget.insert(END, f"総メールボックス通信数: {len(self.mailbox_data)}\n\n")
         
         # プロトコル別統計
-        protocol_stats = Counter()
-        for mb in self.mailbox_data:
-            protocol_stats[mb['mb_protocol']] += 1
-            
         text_widget.insert(END, "【プロトコル別統計】\n")
-        for protocol, count in protocol_stats.most_common():
-            text_widget.insert(END, f"{protocol}: {count}通信\n")
+        if not self.df.empty:
+            for protocol, count in self.df['mb_protocol'].value_counts().items():
+                text_widget.insert(END, f"{protocol}: {count}通信\n")
             
         # ノード別統計
         text_widget.insert(END, "\n【ノード別メールボックス通信】\n")
-        node_stats = defaultdict(lambda: {'send': 0, 'recv': 0})
+        send, recv = Counter(), Counter()
         
         for mb in self.mailbox_data:
-            logaddr = mb['logaddr']
-            if self.board_parser:
-                board_name = self.board_parser.get_board_name(logaddr)
-                node_name = board_name if board_name else f"0x{logaddr}"
-            else:
-                node_name = f"0x{logaddr}"
-                
-            if mb['cmd'] in ['0c', '0e']:  # Read
-                node_stats[node_name]['recv'] += 1
-            else:  # Write
-                node_stats[node_name]['send'] += 1
+            # Read (FPRD/FPRW) は受信、それ以外は送信
+            (recv if mb['cmd'] in _READ_CMDS else send)[self._node_name(mb['logaddr'])] += 1
                 
-        for node, stats in sorted(node_stats.items()):
-            text_widget.insert(END, f"{node}: 送信{stats['send']}回, 受信{stats['recv']}回\n")
+        for node in sorted(send.keys() | recv.keys()):
+            text_widget.insert(END, f"{node}: 送信{send[node]}回, 受信{recv[node]}回\n")
             
         text_widget.config(state=DISABLED)
         
-    def create_coe_analysis_tab(self, notebook):
+    def create_coe_analysis_tab(self, tab):
         """CoE解析タブを作成"""
-        tab = Frame(notebook)
-        notebook.add(tab, text="CoE解析")
-        
         # CoE通信のみをフィルタ
         coe_data = [mb for mb in self.mailbox_data if mb['mb_type'] == 0x01]
         
@@ -251,7 +390,7 @@ class MailboxAnalyzer:
                 
         # グラフ表示
         if sdo_stats:
-            fig, ax = plt.subplots(figsize=(8, 4))
+            fig, ax = plt.subplots(figsize=(8, 4), dpi=_FIGURE_DPI)
             commands = list(sdo_stats.keys())
             counts = list(sdo_stats.values())
             
@@ -286,39 +425,51 @@ class MailboxAnalyzer:
         for col in columns:
             tree.heading(col, text=col)
             
+        # 表示する行を先にまとめて作成
+        rows = [
+            (
+                mb['packet_no'],
+                mb['time'],
+                self._node_name(mb['logaddr']),
+                mb['sdo_command'],
+                mb.get('sdo_index', ''),
+                mb.get('sdo_subindex', ''),
+                mb['sdo_data'][:20] + '...' if mb.get('sdo_data') else ''
+            )
+            for mb in coe_data if 'sdo_command' in mb
+        ]
+        loaded = 0
+        
+        def load_more_rows():
+            """次のページ分の行を追加"""
+            nonlocal loaded
+            if loaded >= len(rows):
+                return
+            # 挿入中は列の描画を止めてレイアウト計算を省く
+            tree['displaycolumns'] = ()
+            for values in rows[loaded:loaded + _TREE_PAGE_SIZE]:
+                tree.insert('', END, values=values)
+            tree['displaycolumns'] = columns
+            loaded += _TREE_PAGE_SIZE
+            
+        def on_tree_scroll(first, last):
+            """末尾までスクロールしたら続きを読み込む"""
+            vsb.set(first, last)
+            if float(last) >= 1.0 and loaded < len(rows):
+                tree.after_idle(load_more_rows)
+                
         # スクロールバー
         vsb = Scrollbar(list_frame, orient=VERTICAL, command=tree.yview)
         vsb.pack(side=tk.RIGHT, fill=tk.Y)
-        tree.configure(yscrollcommand=vsb.set)
+        tree.configure(yscrollcommand=on_tree_scroll)
         
-        # データを追加
-        for mb in coe_data:
-            if 'sdo_command' in mb:
-                logaddr = mb['logaddr']
-                if self.board_parser:
-                    board_name = self.board_parser.get_board_name(logaddr)
-                    node = board_name if board_name else f"0x{logaddr}"
-                else:
-                    node = f"0x{logaddr}"
-                    
-                values = (
-                    mb['packet_no'],
-                    mb['time'],
-                    node,
-                    mb.get('sdo_command', ''),
-                    mb.get('sdo_index', ''),
-                    mb.get('sdo_subindex', ''),
-                    mb.get('sdo_data', '')[:20] + '...' if mb.get('sdo_data', '') else ''
-                )
-                tree.insert('', END, values=values)
+        # 最初のページのみ追加（残りはスクロール時に遅延読み込み）
+        load_more_rows()
                 
         tree.pack(fill=tk.BOTH, expand=True)
         
-    def create_mailbox_sequence_tab(self, notebook):
+    def create_mailbox_sequence_tab(self, tab):
         """メールボックスシーケンスタブを作成"""
-        tab = Frame(notebook)
-        notebook.add(tab, text="通信シーケンス")
-        
         # シーケンス図を表示
         if not self.mailbox_data:
             Label(tab, text="表示するデータがありません").pack(pady=20)
@@ -329,7 +480,7 @@ class MailboxAnalyzer:
         graph_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # 時系列でメールボックス通信を可視化
-        fig, ax = plt.subplots(figsize=(12, 8))
+        fig, ax = plt.subplots(figsize=(12, 8), dpi=_FIGURE_DPI)
         
         # ノードリストを作成
         nodes = set()
@@ -340,32 +491,23 @@ class MailboxAnalyzer:
         nodes = sorted(list(nodes))
         node_positions = {node: i for i, node in enumerate(nodes)}
         
-        # 通信を矢印で表示
-        for i, mb in enumerate(self.mailbox_data[:100]):  # 最初の100個のみ
-            src_pos = node_positions.get(mb['src'], 0)
-            dst_pos = node_positions.get(mb['dst'], 1)
-            
-            # プロトコルによって色分け
-            color_map = {
-                0x01: 'blue',   # CoE
-                0x02: 'green',  # EoE
-                0x03: 'orange', # FoE
-                0x04: 'red',    # SoE
-                0x05: 'purple'  # VoE
-            }
-            color = color_map.get(mb['mb_type'], 'gray')
-            
-            ax.annotate('', xy=(dst_pos, i), xytext=(src_pos, i),
-                       arrowprops=dict(arrowstyle='->', color=color, lw=1.5))
-            
-            # ラベル
-            if 'sdo_command' in mb:
-                label = mb['sdo_command'].split()[0]
-            else:
-                label = mb['mb_protocol'].split()[0]
-                
-            ax.text((src_pos + dst_pos) / 2, i, label, 
-                   ha='center', va='bottom', fontsize=8)
+        # 通信を矢印で表示（最初の100個のみ、1つのコレクションとしてまとめて描画）
+        shown = self.mailbox_data[:100]
+        src_arr = np.array([node_positions.get(mb['src'], 0) for mb in shown], dtype=float)
+        dst_arr = np.array([node_positions.get(mb['dst'], 1) for mb in shown], dtype=float)
+        y_arr = np.arange(len(shown), dtype=float)
+        
+        # プロトコルによって色分け
+        colors = [self._SEQ_COLOR_MAP.get(mb['mb_type'], 'gray') for mb in shown]
+        
+        segments = np.column_stack([src_arr, y_arr, dst_arr, y_arr]).reshape(-1, 2, 2)
+        ax.add_collection(LineCollection(segments, colors=colors, linewidths=1.5))
+        ax.quiver(src_arr, y_arr, dst_arr - src_arr, np.zeros_like(y_arr),
+                  angles='xy', scale_units='xy', scale=1, color=colors, width=0.002)
+        
+        # ラベル
+        for x, y, mb in zip(((src_arr + dst_arr) / 2).tolist(), y_arr.tolist(), shown):
+            ax.text(x, y, mb['label'], ha='center', va='bottom', fontsize=8)
         
         # 軸設定
         ax.set_xlim(-0.5, len(nodes) - 0.5)
@@ -383,25 +525,33 @@ class MailboxAnalyzer:
         canvas.draw()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
-    def create_object_dictionary_tab(self, notebook):
+    def create_object_dictionary_tab(self, tab):
         """オブジェクトディクショナリタブを作成"""
-        tab = Frame(notebook)
-        notebook.add(tab, text="オブジェクトディクショナリ")
-        
         # アクセスされたオブジェクトを集計
-        object_access = defaultdict(lambda: {'read': 0, 'write': 0, 'values': []})
+        reads, writes = Counter(), Counter()
+        values = defaultdict(list)  # オブジェクトごとのユニーク値（表示分+1個まで）
+        objects = set()  # Upload/Download以外（Abort等）のみのオブジェクトも0/0で表示する
         
         for mb in self.mailbox_data:
             if 'sdo_index' in mb and 'sdo_subindex' in mb:
                 obj_key = f"{mb['sdo_index']}:{mb['sdo_subindex']}"
+                objects.add(obj_key)
+                sdo_command = mb.get('sdo_command', '')
                 
-                if 'Upload' in mb.get('sdo_command', ''):
-                    object_access[obj_key]['read'] += 1
-                elif 'Download' in mb.get('sdo_command', ''):
-                    object_access[obj_key]['write'] += 1
+                if 'Upload' in sdo_command:
+                    reads[obj_key] += 1
+                elif 'Download' in sdo_command:
+                    writes[obj_key] += 1
                     
-                if 'sdo_data' in mb and mb['sdo_data']:
-                    object_access[obj_key]['values'].append(mb['sdo_data'])
+                sdo_data = mb.get('sdo_data')
+                if sdo_data:
+                    obj_values = values[obj_key]
+                    if len(obj_values) < 6:
+                        # 先頭部分で切れている値は、表示する分だけ元のデータグラムから全体を取得
+                        if mb['data_len_nib'] > _DATA_HEAD_NIBBLES:
+                            sdo_data = self.full_data(mb)[12:]
+                        if sdo_data not in obj_values:
+                            obj_values.append(sdo_data)
                     
         # ツリービューで表示
         tree_frame = Frame(tab)
@@ -421,17 +571,17 @@ class MailboxAnalyzer:
             tree.heading(col, text=col)
             
         # データを追加
-        for obj_key, stats in sorted(object_access.items()):
-            total = stats['read'] + stats['write']
-            values_str = ', '.join(set(stats['values'][:5]))  # 最初の5個のユニーク値
-            if len(stats['values']) > 5:
+        for obj_key in sorted(objects):
+            obj_values = values.get(obj_key, [])
+            values_str = ', '.join(obj_values[:5])  # 最初の5個のユニーク値
+            if len(obj_values) > 5:
                 values_str += '...'
                 
             tree.insert('', END, values=(
                 obj_key,
-                stats['read'],
-                stats['write'],
-                total,
+                reads[obj_key],
+                writes[obj_key],
+                reads[obj_key] + writes[obj_key],
                 values_str
             ))
             
@@ -453,11 +603,8 @@ class MailboxAnalyzer:
         Label(info_frame, text="0x100A:0x00 - Software Version").pack(anchor=tk.W)
         Label(info_frame, text="0x1018:0x00 - Identity Object").pack(anchor=tk.W)
         
-    def create_mailbox_errors_tab(self, notebook):
+    def create_mailbox_errors_tab(self, tab):
         """エラー解析タブを作成"""
-        tab = Frame(notebook)
-        notebook.add(tab, text="エラー解析")
-        
         # エラーを検出
         errors = []
         
@@ -475,7 +622,7 @@ class MailboxAnalyzer:
                 
         # SDO Abort検出
         for mb in self.mailbox_data:
-            if mb.get('sdo_command', '').startswith('SDO Abort'):
+            if mb.get('sdo_command', '').startswith(_ABORT_PREFIXES):
                 errors.append({
                     'type': 'SDO Abort',
                     'packet': mb
@@ -517,39 +664,45 @@ class MailboxAnalyzer:
         text_widget.config(state=DISABLED)
         
     def find_request_response_pairs(self):
-        """リクエスト・レスポンスのペアを検出"""
+        """リクエスト・レスポンスのペアを検出（結果はキャッシュ）"""
+        if self._pairs_cache is not None:
+            return self._pairs_cache
+            
         pairs = []
-        pending_requests = {}
         
-        for mb in self.mailbox_data:
-            if 'sdo_command' in mb:
-                # リクエスト
-                if 'Request' in mb['sdo_command']:
-                    key = (mb.get('sdo_index', ''), mb.get('sdo_subindex', ''), mb['logaddr'])
-                    pending_requests[key] = mb
-                    
-                # レスポンス
-                elif 'Response' in mb['sdo_command']:
-                    key = (mb.get('sdo_index', ''), mb.get('sdo_subindex', ''), mb['logaddr'])
-                    if key in pending_requests:
-                        request = pending_requests[key]
-                        response_time = mb['timestamp'] - request['timestamp']
-                        
-                        pairs.append({
-                            'request': request,
-                            'response': mb,
-                            'response_time': response_time
-                        })
-                        
-                        del pending_requests[key]
-                        
+        if 'sdo_command' in self.df:
+            keys = ['sdo_index', 'sdo_subindex', 'logaddr']
+            sdo = self.df.reindex(columns=keys + ['sdo_command', 'timestamp'])
+            sdo = sdo[sdo['sdo_command'].notna()].fillna({'sdo_index': '', 'sdo_subindex': ''})
+            sdo['seq'] = sdo.index  # mailbox_data内の位置（通信順）
+            
+            requests = sdo[sdo['sdo_command'].str.endswith('Request')]
+            responses = sdo[sdo['sdo_command'].str.endswith('Response')]
+            
+            # 各レスポンスを、同じキーで直前のリクエストと対応付け
+            merged = pd.merge_asof(
+                responses[keys + ['seq', 'timestamp']],
+                requests[keys + ['seq', 'timestamp']].assign(req_seq=requests['seq']),
+                on='seq', by=keys, direction='backward', suffixes=('', '_req')
+            ).dropna(subset=['req_seq'])
+            
+            # 1つのリクエストに対応するのは最初のレスポンスのみ
+            merged = merged.drop_duplicates(subset='req_seq', keep='first')
+            response_times = merged['timestamp'] - merged['timestamp_req']
+            
+            for resp_seq, req_seq, response_time in zip(
+                    merged['seq'].tolist(), merged['req_seq'].astype(int).tolist(), response_times.tolist()):
+                pairs.append({
+                    'request': self.mailbox_data[req_seq],
+                    'response': self.mailbox_data[resp_seq],
+                    'response_time': response_time
+                })
+                
+        self._pairs_cache = pairs
         return pairs
         
-    def create_statistics_tab(self, notebook):
+    def create_statistics_tab(self, tab):
         """統計タブを作成"""
-        tab = Frame(notebook)
-        notebook.add(tab, text="統計")
-        
         # 統計情報を計算
         stats = self.calculate_statistics()
         
@@ -558,13 +711,17 @@ class MailboxAnalyzer:
         graph_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # 2x2のサブプロット
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8))
+        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8), dpi=_FIGURE_DPI)
+        
+        # 棒グラフは更新時にblitで再描画するため、背景とは別に描画する（animated）
+        self._stats_bars = []
         
         # 1. 時間帯別メールボックス通信数
         if stats['hourly_distribution']:
             hours = list(stats['hourly_distribution'].keys())
             counts = list(stats['hourly_distribution'].values())
-            ax1.bar(hours, counts)
+            bars = ax1.bar(hours, counts, animated=True)
+            self._stats_bars.append((ax1, 'hourly_distribution', hours, bars))
             ax1.set_xlabel('時間')
             ax1.set_ylabel('通信数')
             ax1.set_title('時間帯別メールボックス通信')
@@ -577,9 +734,10 @@ class MailboxAnalyzer:
             ax2.pie(counts, labels=protocols, autopct='%1.1f%%')
             ax2.set_title('プロトコル別分布')
         
-        # 3. レスポンスタイム分布
+        # 3. レスポンスタイム分布（データ数に応じてビン数を抑える）
         if stats['response_times']:
-            ax3.hist(stats['response_times'], bins=50, edgecolor='black')
+            bins = min(50, len(stats['response_times']) // 20 + 1)
+            ax3.hist(stats['response_times'], bins=bins, edgecolor='black')
             ax3.set_xlabel('レスポンスタイム (ms)')
             ax3.set_ylabel('頻度')
             ax3.set_title('レスポンスタイム分布')
@@ -589,7 +747,8 @@ class MailboxAnalyzer:
         if stats['node_communication']:
             nodes = list(stats['node_communication'].keys())[:10]
             counts = list(stats['node_communication'].values())[:10]
-            ax4.barh(nodes, counts)
+            bars = ax4.barh(nodes, counts, animated=True)
+            self._stats_bars.append((ax4, 'node_communication', nodes, bars))
             ax4.set_xlabel('通信数')
             ax4.set_title('ノード別通信頻度（上位10）')
             ax4.grid(True, alpha=0.3)
@@ -597,9 +756,45 @@ class MailboxAnalyzer:
         plt.tight_layout()
         
         canvas = FigureCanvasTkAgg(fig, graph_frame)
+        self._stats_canvas = canvas
+        # 全体描画（初回・リサイズ時）のたびに背景をキャッシュし直して棒を重ねる
+        canvas.mpl_connect('draw_event', self._on_statistics_draw)
         canvas.draw()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
+    def _on_statistics_draw(self, event):
+        """統計タブの全体描画後に背景をキャッシュし、棒グラフを描画"""
+        canvas = self._stats_canvas
+        self._stats_bg = [canvas.copy_from_bbox(ax.bbox) for ax, _, _, _ in self._stats_bars]
+        self._blit_statistics_bars(restore=False)
+        
+    def _blit_statistics_bars(self, restore=True):
+        """キャッシュした背景の上に棒グラフだけを再描画"""
+        canvas = self._stats_canvas
+        for (ax, _, _, bars), background in zip(self._stats_bars, self._stats_bg):
+            if restore:
+                canvas.restore_region(background)
+            for bar in bars:
+                ax.draw_artist(bar)
+            canvas.blit(ax.bbox)
+            
+    def update_statistics(self):
+        """統計を再計算し、統計タブの棒グラフのみをblitで更新"""
+        if not self._stats_canvas or not self._stats_bg:
+            return
+            
+        stats = self.calculate_statistics()
+        for ax, stats_key, labels, bars in self._stats_bars:
+            values = stats[stats_key]
+            horizontal = stats_key == 'node_communication'  # barh
+            for label, bar in zip(labels, bars):
+                if horizontal:
+                    bar.set_width(values.get(label, 0))
+                else:
+                    bar.set_height(values.get(label, 0))
+                    
+        self._blit_statistics_bars()
+        
     def calculate_statistics(self):
         """統計情報を計算"""
         stats = {
@@ -609,22 +804,23 @@ class MailboxAnalyzer:
             'node_communication': Counter()
         }
         
-        # プロトコル分布
-        for mb in self.mailbox_data:
-            stats['protocol_distribution'][mb['mb_protocol'].split()[0]] += 1
-            
-            # ノード別統計
-            logaddr = mb['logaddr']
-            if self.board_parser:
-                board_name = self.board_parser.get_board_name(logaddr)
-                node = board_name if board_name else f"0x{logaddr}"
-            else:
-                node = f"0x{logaddr}"
-            stats['node_communication'][node] += 1
-        
-        # レスポンスタイム統計
+        if not self.df.empty:
+            # 時間帯別分布
+            hours = pd.to_datetime(self.df['time'], errors='coerce').dt.hour.dropna().astype(int)
+            stats['hourly_distribution'].update(hours.value_counts().sort_index().to_dict())
+            
+            # プロトコル分布
+            stats['protocol_distribution'] = Counter(
+                self.df['mb_protocol'].str.split().str[0].value_counts().to_dict())
+            
+            # ノード別統計（上位10）
+            nodes = self.df.assign(node=self.df['logaddr'].map(self._node_name))
+            stats['node_communication'] = Counter(
+                nodes.groupby('node').size().nlargest(10).to_dict())
+        
+        # レスポンスタイム統計（ペアはエラー解析タブと共有のキャッシュから取得）
         pairs = self.find_request_response_pairs()
         for pair in pairs:
             stats['response_times'].append(pair['response_time'] * 1000)  # ms単位
             
-        return statss
\ No newline at end of file
+        return stats
\ No newline at end of file
@@ -2,10 +2,15 @@
 """
 パフォーマンス改善ユーティリティモジュール
 """
+import os
+import re
 import time
+import pickle
 import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from typing import Callable, Any, Optional
-from functools import wraps
+from functools import wraps, partial
 
 # psutilをインポートを追加
 try:
@@ -13,10 +18,21 @@ try:
 except ImportError:
     psutil = None
 
+# 現在のプロセスのハンドル（呼び出しごとの生成を避けるためキャッシュ）
+# フォークした子プロセスは親のハンドルを引き継ぐため、PIDと組で保持する
+_PROC = None
+_PROC_PID = None
+
+# 連続する空白（全角スペース等のUnicode空白を含む）
+_WS_RE = re.compile(r'\s+')
+
 
 class PerformanceMonitor:
     """パフォーマンス監視クラス"""
     
+    # Trueの場合は測定のたびに実行時間を出力
+    verbose = False
+    
     def __init__(self):
         self.execution_times = {}
     
@@ -26,15 +42,15 @@ class PerformanceMonitor:
             @wraps(func)
             def wrapper(*args, **kwargs):
                 name = func_name or func.__name__
-                start_time = time.time()
+                start = time.perf_counter_ns()
                 try:
                     result = func(*args, **kwargs)
                     return result
                 finally:
-                    end_time = time.time()
-                    execution_time = end_time - start_time
+                    execution_time = (time.perf_counter_ns() - start) * 1e-9
                     self.execution_times[name] = execution_time
-                    print(f"[Performance] {name}: {execution_time:.3f}秒")
+                    if self.verbose:
+                        print(f"[Performance] {name}: {execution_time:.3f}秒")
             return wrapper
         return decorator
     
@@ -78,40 +94,32 @@ class DataCache:
     """データキャッシュクラス"""
     
     def __init__(self, max_size: int = 1000):
-        self.cache = {}
+        # 挿入/アクセス順を保持し、先頭が最も古いアクセスのキー
+        self.cache = OrderedDict()
         self.max_size = max_size
-        self.access_order = []
     
     def get(self, key: str) -> Any:
         """キャッシュからデータを取得"""
         if key in self.cache:
             # アクセス順序を更新
-            self.access_order.remove(key)
-            self.access_order.append(key)
+            self.cache.move_to_end(key)
             return self.cache[key]
         return None
     
     def set(self, key: str, value: Any):
         """キャッシュにデータを設定"""
         if key in self.cache:
-            # 既存のキーの場合は値を更新
-            self.cache[key] = value
-            self.access_order.remove(key)
-            self.access_order.append(key)
-        else:
-            # 新しいキーの場合
-            if len(self.cache) >= self.max_size:
-                # 最も古いアクセスのキーを削除
-                oldest_key = self.access_order.pop(0)
-                del self.cache[oldest_key]
-            
-            self.cache[key] = value
-            self.access_order.append(key)
+            # 既存のキーの場合はアクセス順序を更新
+            self.cache.move_to_end(key)
+        elif len(self.cache) >= self.max_size:
+            # 最も古いアクセスのキーを削除
+            self.cache.popitem(last=False)
+        
+        self.cache[key] = value
     
     def clear(self):
         """キャッシュをクリア"""
         self.cache.clear()
-        self.access_order.clear()
     
     def size(self) -> int:
         """キャッシュサイズを取得"""
@@ -126,63 +134,96 @@ class BatchProcessor:
     
     def process_in_batches(self, items: list, processor: Callable, progress_callback: Optional[Callable] = None):
         """アイテムをバッチ処理"""
-        results = []
         total_items = len(items)
+        # 結果リストを一度だけ確保し、インデックスで書き込む（エラー時はNoneのまま）
+        results = [None] * total_items
         
         for i in range(0, total_items, self.batch_size):
-            batch = items[i:i + self.batch_size]
-            batch_results = []
+            end = min(i + self.batch_size, total_items)
             
-            for item in batch:
+            for j in range(i, end):
                 try:
-                    result = processor(item)
-                    batch_results.append(result)
+                    results[j] = processor(items[j])
                 except Exception as e:
                     error_message = str(e)  # 例外メッセージをローカル変数にコピー
                     print(f"バッチ処理エラー: {error_message}")
-                    batch_results.append(None)
-            
-            results.extend(batch_results)
             
             # 進捗報告
             if progress_callback:
-                progress = min(100, int((i + len(batch)) / total_items * 100))
-                progress_callback(progress, f"{i + len(batch)}/{total_items}件処理完了")
+                progress = min(100, int(end / total_items * 100))
+                progress_callback(progress, f"{end}/{total_items}件処理完了")
+        
+        return results
+    
+    def process_parallel(self, items: list, processor: Callable, progress_callback: Optional[Callable] = None,
+                         workers: Optional[int] = None):
+        """アイテムを複数プロセスで並列処理
+        
+        Args:
+            items: 処理対象のアイテム
+            processor: 各アイテムを処理する関数（pickle可能であること）
+            progress_callback: 進捗通知コールバック
+            workers: ワーカープロセス数（Noneの場合はCPU数）
+            
+        Returns:
+            list: 処理結果（itemsと同じ順序、エラー時はNone）
+        """
+        try:
+            pickle.dumps(processor)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            # ラムダやローカル関数はプロセス間で渡せないため逐次処理
+            return self.process_in_batches(items, processor, progress_callback)
+        
+        results = []
+        total_items = len(items)
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for result in executor.map(partial(_process_item, processor), items, chunksize=self.batch_size):
+                results.append(result)
+                
+                # 進捗報告（バッチ単位）
+                done = len(results)
+                if progress_callback and (done % self.batch_size == 0 or done == total_items):
+                    progress = min(100, int(done / total_items * 100))
+                    progress_callback(progress, f"{done}/{total_items}件処理完了")
         
         return results
 
 
+def _process_item(processor: Callable, item: Any) -> Any:
+    """1件を処理し、例外時はNoneを返す（ワーカープロセスで実行）"""
+    try:
+        return processor(item)
+    except Exception as e:
+        error_message = str(e)  # 例外メッセージをローカル変数にコピー
+        print(f"バッチ処理エラー: {error_message}")
+        return None
+
+
 class MemoryOptimizer:
     """メモリ最適化クラス"""
     
     @staticmethod
     def optimize_data_structure(data: list) -> list:
         """データ構造を最適化"""
-        # 重複データの除去や圧縮などの最適化処理
-        optimized_data = []
-        seen = set()
+        # 重複データの除去（dictの挿入順保持を利用し、最初の出現を残す）
+        if not any(isinstance(item, dict) for item in data):
+            # ハッシュ可能な値のみの場合
+            return list(dict.fromkeys(data))
         
+        unique = {}
         for item in data:
             # 辞書の場合はキーでユニーク性をチェック
-            if isinstance(item, dict):
-                key = item.get('No', id(item))
-                if key not in seen:
-                    seen.add(key)
-                    optimized_data.append(item)
-            else:
-                if item not in seen:
-                    seen.add(item)
-                    optimized_data.append(item)
+            key = item.get('No', id(item)) if isinstance(item, dict) else item
+            unique.setdefault(key, item)
         
-        return optimized_data
+        return list(unique.values())
     
     @staticmethod
     def compress_string_data(data: str) -> str:
         """文字列データの圧縮（簡易版）"""
         # 連続する空白の圧縮
-        import re
-        compressed = re.sub(r'\s+', ' ', data)
-        return compressed.strip()
+        return _WS_RE.sub(' ', data).strip()
 
 
 # memory_usage_psutil関数を追加
@@ -193,15 +234,19 @@ def memory_usage_psutil():
     Returns:
         float: メモリ使用量（MB）、psutilがインストールされていない場合は0
     """
+    global _PROC, _PROC_PID
     if psutil is None:
         print("警告: psutilがインストールされていません。'pip install psutil'でインストールしてください。")
         return 0
         
-    # 現在のプロセスを取得
-    process = psutil.Process()
-    
+    # 初回またはPIDが変わった（フォーク後の子プロセス）場合はハンドルを作り直す
+    pid = os.getpid()
+    if _PROC_PID != pid:
+        _PROC = psutil.Process(pid)
+        _PROC_PID = pid
+        
     # メモリ情報を取得 (バイト単位)
-    memory_info = process.memory_info()
+    memory_info = _PROC.memory_info()
     
     # MB単位に変換して返す
     return memory_info.rss / (1024 * 1024)
\ No newline at end of file
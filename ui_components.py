@@ -3,14 +3,125 @@
 再利用可能なUIコンポーネントモジュール
 """
 import tkinter as tk
+import tkinter.font as tkFont
 from tkinter import ttk, Frame, Label, Button, Entry, StringVar, IntVar, Toplevel
-from typing import Callable, List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional, Tuple
 import threading
+from functools import lru_cache
+import queue
+import weakref
+import re
 import time
 
 
+# Tclリストの要素として区切り・置換の対象になる文字
+_TCL_SPECIAL_RE = re.compile(r'[\s"\\$;\[\]{}]')
+
+# バックスラッシュ＋文字のままでは意味が変わる空白文字のエスケープ
+_TCL_ESCAPES = {'\n': '\\n', '\t': '\\t', '\r': '\\r', '\v': '\\v', '\f': '\\f'}
+
+# カラーコード（#RRGGBB）
+_COLOR_RE = re.compile(r'^#[0-9a-fA-F]{6}$')
+
+# 共有フォント（(Tclインタプリタ, サイズ, 太さ) ごとに初回使用時に作成）
+_fonts: Dict[Tuple[Any, int, str], tkFont.Font] = {}
+
+# destroy()された再利用待ちのフィルタ行（acquire()で作成した行のみ）
+_row_pool: List["FilterRow"] = []
+
+# プールに保持するフィルタ行の上限
+_ROW_POOL_MAX = 32
+
+# Tk/Toplevelのgeometry()文字列のサイズ部分（WxH）
+_GEOMETRY_SIZE_RE = re.compile(r'(\d+)x(\d+)')
+
+
+def _shared_font(widget, size: int, weight: str = "normal") -> tkFont.Font:
+    """ウィジェット間で共有するArialフォントを取得
+    
+    Args:
+        widget: フォントを作成するTkインタプリタのウィジェット
+        size: フォントサイズ
+        weight: "normal" または "bold"
+        
+    Returns:
+        tkFont.Font: 名前付きフォント
+    """
+    key = (widget.tk, size, weight)
+    font = _fonts.get(key)
+    if font is None:
+        font = tkFont.Font(root=widget, family="Arial", size=size, weight=weight)
+        _fonts[key] = font
+    return font
+
+
+def _tcl_quote(value) -> str:
+    """値をTclリストの1要素として解釈される文字列に変換（特殊文字をエスケープ）"""
+    value = str(value)
+    if not value:
+        return '{}'
+    return _TCL_SPECIAL_RE.sub(lambda m: _TCL_ESCAPES.get(m.group(), '\\' + m.group()), value)
+
+
+@lru_cache(maxsize=32)
+def _tcl_list_cached(values: Tuple[str, ...]) -> str:
+    """_tcl_listの変換結果を直近の候補一覧分だけ保持"""
+    return ' '.join(_tcl_quote(value) for value in values)
+
+
+def _tcl_list(values: List[str]) -> str:
+    """候補一覧をTclリスト文字列に変換（同じ候補一覧の変換は再利用）"""
+    return _tcl_list_cached(tuple(values))
+
+
+def _client_geometry(widget) -> Tuple[int, int, int, int]:
+    """ウィジェットのクライアント領域のサイズと画面上の位置を取得
+    
+    geometry()の位置はタイトルバー等の装飾を含む枠の原点のため、位置は常に
+    winfo_rootx()/winfo_rooty()から取得し、サイズのみgeometry()から取得する。
+    
+    Args:
+        widget: 対象のウィジェット
+        
+    Returns:
+        Tuple[int, int, int, int]: (幅, 高さ, X, Y)
+    """
+    match = None
+    if isinstance(widget, (tk.Tk, tk.Toplevel)):
+        match = _GEOMETRY_SIZE_RE.match(widget.geometry())
+    if match:
+        width, height = int(match.group(1)), int(match.group(2))
+    else:
+        width, height = widget.winfo_width(), widget.winfo_height()
+    return width, height, widget.winfo_rootx(), widget.winfo_rooty()
+
+
+def _centered_geometry(parent, width: int, height: int) -> str:
+    """親ウィンドウの中央に配置するための位置指定（+X+Y）を取得
+    
+    呼び出し前にupdate_idletasks()でレイアウトを確定させておくこと。
+    
+    Args:
+        parent: 親ウィジェット
+        width: 配置するウィンドウの幅
+        height: 配置するウィンドウの高さ
+        
+    Returns:
+        str: geometry()に渡す位置指定文字列
+    """
+    parent_width, parent_height, parent_x, parent_y = _client_geometry(parent)
+    
+    x = parent_x + (parent_width - width) // 2
+    y = parent_y + (parent_height - height) // 2
+    return f"+{x}+{y}"
+
+
 class FilterRow:
-    """フィルタ行コンポーネント"""
+    """フィルタ行コンポーネント
+    
+    acquire()で取得した行はdestroy()時にプールに戻され（上限あり）、同じ親・同じ構成の行として
+    再利用される。コンストラクタで直接作成した行はdestroy()でウィジェットを破棄する。
+    """
     
     def __init__(self, parent: Frame, row_idx: int, fields: List[str], conditions: List[str], 
                  remove_callback: Optional[Callable] = None, hint_text: str = ""):
@@ -19,6 +130,9 @@ class FilterRow:
         self.fields = fields
         self.conditions = conditions
         self.remove_callback = remove_callback
+        self._layout = self._layout_key(row_idx, remove_callback, hint_text)
+        # acquire()経由で作成され、destroy()時にプールへ戻せる行かどうか
+        self._poolable = False
         
         self.frame = Frame(parent)
         self.frame.pack(fill=tk.X, pady=2)
@@ -27,15 +141,67 @@ class FilterRow:
         self.field_var = StringVar()
         self.condition_var = StringVar()
         self.value_var = StringVar()
-        
-        # デフォルト値の設定
-        if fields:
-            self.field_var.set(fields[0])
-        if conditions:
-            self.condition_var.set(conditions[0])
+        self._reset_values()
         
         self._create_widgets(hint_text)
     
+    @classmethod
+    def acquire(cls, parent: Frame, row_idx: int, fields: List[str], conditions: List[str],
+                remove_callback: Optional[Callable] = None, hint_text: str = "") -> "FilterRow":
+        """フィルタ行を取得（プールに再利用可能な行があればウィジェットを作り直さずに使う）
+        
+        Args:
+            parent: 配置先のフレーム
+            row_idx: 行番号
+            fields: フィールドの候補
+            conditions: 条件の候補
+            remove_callback: 削除ボタン押下時のコールバック
+            hint_text: ヒント文字列（最初の行のみ表示）
+            
+        Returns:
+            FilterRow: 初期値に戻したフィルタ行
+        """
+        layout = cls._layout_key(row_idx, remove_callback, hint_text)
+        for i in range(len(_row_pool) - 1, -1, -1):
+            row = _row_pool[i]
+            if not row.frame.winfo_exists():
+                # 親ごと破棄された行はプールから除く
+                del _row_pool[i]
+            elif row.parent is parent and row._layout == layout:
+                del _row_pool[i]
+                row._reuse(row_idx, fields, conditions, remove_callback)
+                return row
+        row = cls(parent, row_idx, fields, conditions, remove_callback, hint_text)
+        row._poolable = True
+        return row
+    
+    @staticmethod
+    def _layout_key(row_idx: int, remove_callback: Optional[Callable], hint_text: str):
+        """行のウィジェット構成を表すキー（同じキーの行同士は再利用可能）"""
+        if row_idx == 0:
+            return (True, False, hint_text)
+        return (False, remove_callback is not None, "")
+    
+    def _reuse(self, row_idx: int, fields: List[str], conditions: List[str],
+               remove_callback: Optional[Callable]):
+        """プールから取り出した行を新しい設定で再表示"""
+        self.row_idx = row_idx
+        self.remove_callback = remove_callback
+        if fields != self.fields:
+            self.fields = fields
+            self.field_dropdown.configure(values=_tcl_list(fields))
+        if conditions != self.conditions:
+            self.conditions = conditions
+            self.condition_dropdown.configure(values=_tcl_list(conditions))
+        self._reset_values()
+        self.frame.pack(fill=tk.X, pady=2)
+    
+    def _reset_values(self):
+        """入力値を初期状態に戻す"""
+        self.field_var.set(self.fields[0] if self.fields else "")
+        self.condition_var.set(self.conditions[0] if self.conditions else "")
+        self.value_var.set("")
+    
     def _create_widgets(self, hint_text: str):
         """ウィジェットの作成"""
         # ラベルは最初の行のみ表示
@@ -48,7 +214,7 @@ class FilterRow:
         self.field_dropdown = ttk.Combobox(
             self.frame, 
             textvariable=self.field_var, 
-            values=self.fields
+            values=_tcl_list(self.fields)
         )
         self.field_dropdown.grid(row=0, column=1, padx=5, pady=2, sticky=tk.W)
         
@@ -56,7 +222,7 @@ class FilterRow:
         self.condition_dropdown = ttk.Combobox(
             self.frame, 
             textvariable=self.condition_var, 
-            values=self.conditions, 
+            values=_tcl_list(self.conditions), 
             width=15
         )
         self.condition_dropdown.grid(row=0, column=2, padx=5, pady=2, sticky=tk.W)
@@ -71,7 +237,7 @@ class FilterRow:
             self.remove_btn = Button(
                 self.frame, 
                 text="✕", 
-                command=lambda: self.remove_callback(self)
+                command=self._on_remove
             )
             self.remove_btn.grid(row=0, column=5, padx=5, pady=2)
         
@@ -80,10 +246,14 @@ class FilterRow:
             self.hint_label = Label(
                 self.frame, 
                 text=hint_text, 
-                font=("Arial", 8)
+                font=_shared_font(self.frame, 8)
             )
             self.hint_label.grid(row=1, column=0, columnspan=6, padx=5, pady=0, sticky=tk.W)
     
+    def _on_remove(self):
+        """削除ボタン押下時の処理（プールから再利用された行でも現在のコールバックを呼ぶ）"""
+        self.remove_callback(self)
+    
     def get_values(self) -> Dict[str, str]:
         """フィルタ値を取得"""
         return {
@@ -99,24 +269,42 @@ class FilterRow:
         self.value_var.set(value)
     
     def destroy(self):
-        """フィルタ行を削除"""
-        self.frame.destroy()
+        """フィルタ行を削除（acquire()で取得した行はプールに空きがあれば破棄せず戻す）"""
+        if (self._poolable and len(_row_pool) < _ROW_POOL_MAX
+                and self.parent.winfo_exists()):
+            self.frame.pack_forget()
+            _row_pool.append(self)
+        else:
+            self.frame.destroy()
 
 
 class ProgressDialog:
     """プログレス表示ダイアログ"""
     
-    def __init__(self, parent, title="処理中", message="処理を実行しています..."):
+    # 更新キューを確認する間隔（ミリ秒）
+    PUMP_INTERVAL_MS = 50
+    
+    def __init__(self, parent, title="処理中", message="処理を実行しています...",
+                 total: Optional[int] = None):
         self.parent = parent
         self.title = title
         self.message = message
+        # 総件数（指定時は確定モードで進捗値を表示し、アニメーションは行わない）
+        self.total = total
         self.dialog = None
         self.progress_var = tk.StringVar()
         self.cancelled = False
+        # ワーカースレッドからの更新要求（種別, メッセージ）
+        self._queue = queue.Queue()
+        self._pump_id = None
+        # ダイアログが存在する間True（winfo_exists()の代わりに参照）
+        self._alive = False
         
     def show(self):
         """ダイアログを表示"""
         self.dialog = Toplevel(self.parent)
+        self._alive = True
+        self.dialog.bind("<Destroy>", self._on_destroy)
         self.dialog.title(self.title)
         self.dialog.geometry("400x150")
         self.dialog.resizable(False, False)
@@ -130,20 +318,29 @@ class ProgressDialog:
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # メッセージラベル
-        self.message_label = Label(main_frame, text=self.message, font=("Arial", 10))
+        self.message_label = Label(main_frame, text=self.message, font=_shared_font(main_frame, 10))
         self.message_label.pack(pady=(0, 10))
         
         # プログレスバー
-        self.progress_bar = ttk.Progressbar(
-            main_frame, 
-            mode='indeterminate',
-            length=300
-        )
-        self.progress_bar.pack(pady=(0, 10))
-        self.progress_bar.start(10)
+        if self.total:
+            self.progress_bar = ttk.Progressbar(
+                main_frame, 
+                mode='determinate',
+                maximum=self.total,
+                length=300
+            )
+            self.progress_bar.pack(pady=(0, 10))
+        else:
+            self.progress_bar = ttk.Progressbar(
+                main_frame, 
+                mode='indeterminate',
+                length=300
+            )
+            self.progress_bar.pack(pady=(0, 10))
+            self.progress_bar.start(50)
         
         # プログレス詳細ラベル
-        self.progress_label = Label(main_frame, textvariable=self.progress_var, font=("Arial", 9))
+        self.progress_label = Label(main_frame, textvariable=self.progress_var, font=_shared_font(main_frame, 9))
         self.progress_label.pack(pady=(0, 10))
         
         # キャンセルボタン
@@ -158,37 +355,71 @@ class ProgressDialog:
         # ダイアログを中央に配置
         self._center_dialog()
         
-    def _center_dialog(self):
-        """ダイアログを親ウィンドウの中央に配置"""
-        self.dialog.update_idletasks()
+        # サイズ確定後はメッセージ長の変化で再レイアウトが伝播しないようにする
+        main_frame.pack_propagate(False)
         
-        # 親ウィンドウの位置とサイズを取得
-        parent_x = self.parent.winfo_rootx()
-        parent_y = self.parent.winfo_rooty()
-        parent_width = self.parent.winfo_width()
-        parent_height = self.parent.winfo_height()
+        # 更新キューの処理を開始
+        self._pump_id = self.dialog.after(self.PUMP_INTERVAL_MS, self._drain_queue)
         
+    def _on_destroy(self, event):
+        """ダイアログ破棄時にフラグを下ろす（子ウィジェットのイベントは無視）"""
+        if event.widget is self.dialog:
+            self._alive = False
+        
+    def _drain_queue(self):
+        """キューに溜まった更新をメインスレッドで反映（種別ごとに最新のみ）"""
+        if not self._alive:
+            self._pump_id = None
+            return
+            
+        latest = {}
+        while True:
+            try:
+                kind, message = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            latest[kind] = message
+            
+        if 'progress' in latest:
+            self.progress_var.set(latest['progress'])
+        if 'value' in latest:
+            self.progress_bar['value'] = latest['value']
+        if 'message' in latest:
+            self.message_label.config(text=latest['message'])
+            
+        self._pump_id = self.dialog.after(self.PUMP_INTERVAL_MS, self._drain_queue)
+        
+    def _center_dialog(self):
+        """ダイアログを親ウィンドウの中央に配置"""
         # ダイアログのサイズを取得
+        self.dialog.update_idletasks()
         dialog_width = self.dialog.winfo_reqwidth()
         dialog_height = self.dialog.winfo_reqheight()
         
-        # 中央の座標を計算
-        x = parent_x + (parent_width - dialog_width) // 2
-        y = parent_y + (parent_height - dialog_height) // 2
+        position = _centered_geometry(self.parent, dialog_width, dialog_height)
+        self.dialog.geometry(f"{dialog_width}x{dialog_height}{position}")
         
-        self.dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
+    def update_progress(self, message, value: Optional[int] = None):
+        """プログレス情報を更新
         
-    def update_progress(self, message):
-        """プログレス情報を更新"""
-        if self.dialog and self.dialog.winfo_exists():
-            self.progress_var.set(message)
-            self.dialog.update_idletasks()
+        ワーカースレッドから呼び出し可能。表示への反映はメインスレッドで定期的に行う。
+        
+        Args:
+            message: 進捗の詳細メッセージ
+            value: 処理済み件数（totalを指定した場合のみバーに反映）
+        """
+        # 閉じた後の更新は誰も取り出さないので捨てる
+        if not self._alive:
+            return
+        self._queue.put(('progress', message))
+        if value is not None and self.total:
+            self._queue.put(('value', value))
             
     def update_message(self, message):
-        """メインメッセージを更新"""
-        if self.dialog and self.dialog.winfo_exists():
-            self.message_label.config(text=message)
-            self.dialog.update_idletasks()
+        """メインメッセージを更新（ワーカースレッドから呼び出し可能）"""
+        if not self._alive:
+            return
+        self._queue.put(('message', message))
             
     def cancel(self):
         """処理をキャンセル"""
@@ -201,26 +432,28 @@ class ProgressDialog:
         
     def hide(self):
         """ダイアログを非表示"""
-        if self.dialog and self.dialog.winfo_exists():
+        if self._alive:
+            if self._pump_id:
+                self.dialog.after_cancel(self._pump_id)
+                self._pump_id = None
             self.progress_bar.stop()
             self.dialog.destroy()
-            self.dialog = None
+        self._alive = False
+        self.dialog = None
+        self._queue = queue.Queue()
 
 
 class StatusBar:
     """ステータスバーコンポーネント"""
     
     def __init__(self, parent):
-        self.status_var = StringVar()
-        self.status_var.set("準備完了")
-        
         self.frame = Frame(parent)
         self.frame.pack(side=tk.BOTTOM, fill=tk.X)
         
         # ステータスラベル
         self.status_label = Label(
             self.frame,
-            textvariable=self.status_var,
+            text="準備完了",
             bd=1,
             relief=tk.SUNKEN,
             anchor=tk.W
@@ -228,10 +461,8 @@ class StatusBar:
         self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
         # 追加情報ラベル（右側）
-        self.info_var = StringVar()
         self.info_label = Label(
             self.frame,
-            textvariable=self.info_var,
             bd=1,
             relief=tk.SUNKEN,
             anchor=tk.E,
@@ -241,104 +472,221 @@ class StatusBar:
     
     def set_status(self, message: str):
         """ステータスメッセージを設定"""
-        self.status_var.set(message)
+        self.status_label.config(text=message)
     
     def set_info(self, info: str):
         """追加情報を設定"""
-        self.info_var.set(info)
+        self.info_label.config(text=info)
+
+
+class _ClassBinding:
+    """共通のバインドタグ経由でイベントを各インスタンスに振り分ける
+    
+    イベントはウィジェットごとではなく、バインドタグにインタプリタごとに1回だけバインドし、
+    イベント発生元ウィジェットのパス名から対象インスタンスを引いてメソッドを呼び出す。
+    レジストリは弱参照のため、インスタンスは呼び出し側（ウィジェットの属性など）で保持すること。
+    """
+    
+    def __init__(self, tag: str, handlers: Dict[str, str], prepend: bool = False):
+        """
+        Args:
+            tag: バインドタグ名
+            handlers: イベントシーケンス → 呼び出すインスタンスメソッド名
+            prepend: Trueの場合はバインドタグを先頭に付ける（既定は末尾）
+        """
+        self.tag = tag
+        self.handlers = handlers
+        self.prepend = prepend
+        # ウィジェットのパス名 → インスタンス（ウィジェット破棄とともに消える）
+        self._registry = weakref.WeakValueDictionary()
+        # バインドタグのイベントを登録済みのTclインタプリタ
+        self._bound_interps = set()
+    
+    def attach(self, widget, owner):
+        """ウィジェットにバインドタグを付け、イベントをownerに振り分ける"""
+        self._registry[str(widget)] = owner
+        if widget.tk not in self._bound_interps:
+            for sequence, method in self.handlers.items():
+                widget.bind_class(self.tag, sequence, self._dispatcher(method))
+            self._bound_interps.add(widget.tk)
+        tags = widget.bindtags()
+        if self.tag not in tags:
+            widget.bindtags((self.tag,) + tags if self.prepend else tags + (self.tag,))
+    
+    def _dispatcher(self, method: str) -> Callable:
+        """イベント発生元ウィジェットのインスタンスのメソッドを呼び出すハンドラを作成"""
+        def dispatch(event):
+            owner = self._registry.get(str(event.widget))
+            if owner is not None:
+                getattr(owner, method)(event)
+        return dispatch
 
 
 class ToolTip:
-    """ツールチップ表示クラス"""
+    """ツールチップ表示クラス
+    
+    イベントはウィジェットごとではなく、共通のバインドタグ"Tooltipped"に1回だけバインドする。
+    """
+    
+    # 全インスタンスで共有するツールチップウィンドウ（初回表示時に作成し、以降は再利用）
+    _tip_win = None
+    _tip_label = None
+    # 共有ウィンドウを現在表示しているウィジェットのパス名（非表示時はNone）
+    _owner = None
+    
+    # 表示中のウィジェットが破棄・クリックされた場合は<Leave>が来ないことがあるため閉じる
+    _binding = _ClassBinding("Tooltipped", {
+        "<Enter>": "show_tooltip",
+        "<Leave>": "hide_tooltip",
+        "<ButtonPress>": "hide_tooltip",
+        "<Destroy>": "hide_tooltip",
+    })
     
     def __init__(self, widget, text):
         self.widget = widget
         self.text = text
-        self.tooltip_window = None
         
-        # イベントをバインド
-        self.widget.bind("<Enter>", self.show_tooltip)
-        self.widget.bind("<Leave>", self.hide_tooltip)
-        self.widget.bind("<Motion>", self.on_motion)
+        # ToolTipはウィジェットが保持し、レジストリからは弱参照で引く
+        widget._tooltip = self
+        self._binding.attach(widget, self)
+    
+    @classmethod
+    def _withdraw(cls):
+        """共有ツールチップウィンドウを非表示にする"""
+        if cls._tip_win is not None and cls._tip_win.winfo_exists():
+            cls._tip_win.withdraw()
+        cls._owner = None
     
     def show_tooltip(self, event=None):
         """ツールチップを表示"""
-        if self.tooltip_window or not self.text:
+        cls = type(self)
+        owner = str(self.widget)
+        if cls._owner == owner or not self.text:
             return
             
         x = self.widget.winfo_rootx() + 20
         y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
         
-        self.tooltip_window = Toplevel(self.widget)
-        self.tooltip_window.wm_overrideredirect(True)
-        self.tooltip_window.wm_geometry(f"+{x}+{y}")
+        if cls._tip_win is None or not cls._tip_win.winfo_exists():
+            cls._create_tip_window(self.widget.nametowidget('.'))
         
-        label = Label(
-            self.tooltip_window,
-            text=self.text,
+        cls._tip_label.config(text=self.text)
+        cls._tip_win.wm_geometry(f"+{x}+{y}")
+        cls._tip_win.deiconify()
+        cls._tip_win.lift()
+        cls._owner = owner
+    
+    @classmethod
+    def _create_tip_window(cls, root):
+        """共有ツールチップウィンドウを作成（非表示状態）"""
+        cls._tip_win = Toplevel(root)
+        cls._tip_win.withdraw()
+        cls._tip_win.wm_overrideredirect(True)
+        
+        cls._tip_label = Label(
+            cls._tip_win,
             background="#ffffe0",
             relief="solid",
             borderwidth=1,
-            font=("Arial", 9),
+            font=_shared_font(cls._tip_win, 9),
             padx=5,
             pady=3
         )
-        label.pack()
+        cls._tip_label.pack()
     
     def hide_tooltip(self, event=None):
-        """ツールチップを非表示"""
-        if self.tooltip_window:
-            self.tooltip_window.destroy()
-            self.tooltip_window = None
-            
-    def on_motion(self, event=None):
-        """マウス移動時の処理"""
-        # ツールチップの位置を更新
-        if self.tooltip_window:
-            x = self.widget.winfo_rootx() + 20
-            y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
-            self.tooltip_window.wm_geometry(f"+{x}+{y}")
+        """ツールチップを非表示（このウィジェットが表示中の場合のみ）"""
+        if type(self)._owner == str(self.widget):
+            type(self)._withdraw()
 
 
 class SearchableCombobox(ttk.Combobox):
     """検索可能なコンボボックス"""
     
+    # 入力が止まってから絞り込みを行うまでの待ち時間（ミリ秒）
+    FILTER_DELAY_MS = 120
+    
     def __init__(self, parent, values: List[str], **kwargs):
         super().__init__(parent, **kwargs)
-        self.all_values = values
-        self.configure(values=values)
+        self._pending_id = None
+        # 前回絞り込んだ入力文字列と、現在ドロップダウンに設定している候補
+        self._last_text = None
+        self._last_filtered = None
+        self.set_values(values)
         
         # 検索機能のバインド
         self.bind('<KeyRelease>', self.on_key_release)
         self.bind('<Button-1>', self.on_click)
     
     def on_key_release(self, event):
-        """キー入力時の検索処理"""
+        """キー入力時の検索処理（連続入力中は最後の入力から一定時間後に1回だけ絞り込む）"""
+        if self._pending_id:
+            self.after_cancel(self._pending_id)
+        self._pending_id = self.after(self.FILTER_DELAY_MS, self._apply_filter)
+    
+    def _apply_filter(self):
+        """入力文字列で候補を絞り込む"""
+        self._pending_id = None
         current_text = self.get().lower()
         
+        # Shiftや矢印キーなど、入力文字列が変わらないキーでは何もしない
+        if current_text == self._last_text:
+            return
+        self._last_text = current_text
+        
         if not current_text:
             # 空の場合は全ての値を表示
-            self.configure(values=self.all_values)
+            self._set_dropdown_values(self.all_values)
         else:
             # 入力文字列を含む値のみを表示
             filtered_values = [
-                value for value in self.all_values 
-                if current_text in value.lower()
+                value for lower_value, value in zip(self._lower_values, self.all_values)
+                if current_text in lower_value
             ]
-            self.configure(values=filtered_values)
+            self._set_dropdown_values(filtered_values)
+    
+    def _set_dropdown_values(self, values: List[str]):
+        """ドロップダウンの候補を設定（現在の候補と同じ場合は再設定しない）"""
+        last = self._last_filtered
+        # 件数と先頭・末尾で安価に差分を判定してから全体を比較
+        if (last is not None and len(values) == len(last)
+                and values[:1] == last[:1] and values[-1:] == last[-1:]
+                and values == last):
+            return
+        self.configure(values=values)
+        self._last_filtered = values
+    
+    def set_values(self, values: List[str]):
+        """候補の一覧を設定（検索用の小文字一覧も合わせて更新）"""
+        self.all_values = values
+        self._lower_values = [value.lower() for value in values]
+        self._last_text = None
+        self._last_filtered = None
+        self._set_dropdown_values(values)
     
     def on_click(self, event):
         """クリック時に全ての値を表示"""
-        self.configure(values=self.all_values)
+        # 次の入力で改めて絞り込むよう、前回の入力文字列を忘れる
+        self._last_text = None
+        self._set_dropdown_values(self.all_values)
 
 
 class CollapsibleFrame:
-    """折りたたみ可能なフレーム"""
+    """折りたたみ可能なフレーム
+    
+    content_builderを指定した場合、コンテンツは初めて展開したときに作成される。
+    タイトル部のクリックは共通のバインドタグ"CollapsibleTitle"に1回だけバインドする。
+    """
+    
+    _binding = _ClassBinding("CollapsibleTitle", {"<Button-1>": "toggle"}, prepend=True)
     
-    def __init__(self, parent, title: str, initial_state: bool = True):
+    def __init__(self, parent, title: str, initial_state: bool = True,
+                 content_builder: Optional[Callable[[Frame], None]] = None):
         self.parent = parent
         self.title = title
         self.is_expanded = initial_state
+        self._builder = content_builder
+        self._built = False
         
         # メインフレーム
         self.main_frame = Frame(parent)
@@ -355,7 +703,7 @@ class CollapsibleFrame:
         self.icon_label = Label(
             self.title_frame, 
             textvariable=self.icon_var, 
-            font=("Arial", 10)
+            font=_shared_font(self.title_frame, 10)
         )
         self.icon_label.pack(side=tk.LEFT, padx=5)
         
@@ -363,19 +711,22 @@ class CollapsibleFrame:
         self.title_label = Label(
             self.title_frame, 
             text=title, 
-            font=("Arial", 10, "bold")
+            font=_shared_font(self.title_frame, 10, "bold")
         )
         self.title_label.pack(side=tk.LEFT, padx=5)
         
         # コンテンツフレーム
         self.content_frame = Frame(self.main_frame)
         if self.is_expanded:
+            self._build_content()
             self.content_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
         # クリックイベントのバインド
-        self.title_frame.bind("<Button-1>", self.toggle)
-        self.icon_label.bind("<Button-1>", self.toggle)
-        self.title_label.bind("<Button-1>", self.toggle)
+        # Tkのイベントは親フレームへ伝播しないため、タイトル部の3ウィジェットに
+        # 全インスタンス共通のバインドタグを付け、ハンドラはインタプリタごとに1回だけ登録する
+        self.title_frame._collapsible = self
+        for widget in (self.title_frame, self.icon_label, self.title_label):
+            self._binding.attach(widget, self)
     
     def update_icon(self):
         """アイコンを更新"""
@@ -387,10 +738,17 @@ class CollapsibleFrame:
         self.update_icon()
         
         if self.is_expanded:
+            self._build_content()
             self.content_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         else:
             self.content_frame.pack_forget()
     
+    def _build_content(self):
+        """初回展開時にコンテンツを作成"""
+        if self._builder and not self._built:
+            self._builder(self.content_frame)
+            self._built = True
+    
     def get_content_frame(self) -> Frame:
         """コンテンツフレームを取得"""
         return self.content_frame 
@@ -399,11 +757,19 @@ class CollapsibleFrame:
 class StatusProgressBar:
     """ステータスバー内のプログレスバー"""
     
+    # 更新キューを確認する間隔（ミリ秒）
+    PUMP_INTERVAL_MS = 50
+    
     def __init__(self, parent_frame):
         self.parent_frame = parent_frame
         self.progress_frame = None
         self.progress_bar = None
         self.status_label = None
+        # ワーカースレッドからのステータス更新要求
+        self._queue = queue.Queue()
+        self._pump_id = None
+        # プログレスバーが存在する間True（winfo_exists()の代わりに参照）
+        self._alive = False
         
     def show(self, message="処理中..."):
         """プログレスバーを表示"""
@@ -412,8 +778,10 @@ class StatusProgressBar:
             
         self.progress_frame = Frame(self.parent_frame)
         self.progress_frame.pack(side=tk.RIGHT, padx=5)
+        self._alive = True
+        self.progress_frame.bind("<Destroy>", self._on_destroy)
         
-        self.status_label = Label(self.progress_frame, text=message, font=("Arial", 9))
+        self.status_label = Label(self.progress_frame, text=message, font=_shared_font(self.progress_frame, 9))
         self.status_label.pack(side=tk.LEFT, padx=(0, 5))
         
         self.progress_bar = ttk.Progressbar(
@@ -422,22 +790,53 @@ class StatusProgressBar:
             length=100
         )
         self.progress_bar.pack(side=tk.LEFT)
-        self.progress_bar.start(10)
+        self.progress_bar.start(50)
         
-    def update_status(self, message):
-        """ステータスメッセージを更新"""
-        if self.status_label:
+        # 更新キューの処理を開始
+        self._pump_id = self.progress_frame.after(self.PUMP_INTERVAL_MS, self._drain_queue)
+        
+    def _on_destroy(self, event):
+        """フレーム破棄時（親ウィンドウごと閉じられた場合など）にフラグを下ろす"""
+        self._alive = False
+        
+    def _drain_queue(self):
+        """キューに溜まったステータスをメインスレッドで反映（最新のみ）"""
+        if not self._alive:
+            self._pump_id = None
+            return
+            
+        message = None
+        while True:
+            try:
+                message = self._queue.get_nowait()
+            except queue.Empty:
+                break
+                
+        if message is not None:
             self.status_label.config(text=message)
             
+        self._pump_id = self.progress_frame.after(self.PUMP_INTERVAL_MS, self._drain_queue)
+        
+    def update_status(self, message):
+        """ステータスメッセージを更新（ワーカースレッドから呼び出し可能）"""
+        # 非表示後の更新は誰も取り出さないので捨てる
+        if not self._alive:
+            return
+        self._queue.put(message)
+            
     def hide(self):
         """プログレスバーを非表示"""
-        if self.progress_bar:
+        if self._alive:
+            if self._pump_id:
+                self.progress_frame.after_cancel(self._pump_id)
+                self._pump_id = None
             self.progress_bar.stop()
-        if self.progress_frame:
             self.progress_frame.destroy()
-            self.progress_frame = None
-            self.progress_bar = None
-            self.status_label = None
+        self._alive = False
+        self.progress_frame = None
+        self.progress_bar = None
+        self.status_label = None
+        self._queue = queue.Queue()
 
 
 class LoadingOverlay:
@@ -447,8 +846,13 @@ class LoadingOverlay:
         self.parent = parent
         self.overlay = None
         
-    def show(self, message="読み込み中..."):
-        """オーバーレイを表示"""
+    def show(self, message="読み込み中...", modal: bool = False):
+        """オーバーレイを表示
+        
+        Args:
+            message: 表示するメッセージ
+            modal: Trueの場合は入力をオーバーレイに集める（表示のみの用途ではgrabしない）
+        """
         if self.overlay:
             return
             
@@ -457,22 +861,27 @@ class LoadingOverlay:
         self.overlay.configure(bg='white')
         self.overlay.attributes('-alpha', 0.8)
         self.overlay.overrideredirect(True)
+        # サイズは親に合わせて固定するため、子ウィジェットからのサイズ伝播は不要
+        self.overlay.pack_propagate(False)
+        self.overlay.grid_propagate(False)
         
         # 親ウィンドウと同じサイズ・位置に設定
-        self.overlay.geometry(f"{self.parent.winfo_width()}x{self.parent.winfo_height()}+{self.parent.winfo_rootx()}+{self.parent.winfo_rooty()}")
+        width, height, x, y = _client_geometry(self.parent)
+        self.overlay.geometry(f"{width}x{height}+{x}+{y}")
         
         # メッセージとプログレスバー
         frame = Frame(self.overlay, bg='white')
         frame.place(relx=0.5, rely=0.5, anchor='center')
         
-        Label(frame, text=message, font=("Arial", 12), bg='white').pack(pady=10)
+        Label(frame, text=message, font=_shared_font(frame, 12), bg='white').pack(pady=10)
         
         progress = ttk.Progressbar(frame, mode='indeterminate', length=200)
         progress.pack(pady=10)
-        progress.start(10)
+        progress.start(50)
         
         self.overlay.transient(self.parent)
-        self.overlay.grab_set()
+        if modal:
+            self.overlay.grab_set()
         
     def hide(self):
         """オーバーレイを非表示"""
@@ -511,7 +920,7 @@ class DataHighlightDialog:
         color_frame = Frame(main_frame)
         color_frame.pack(fill=tk.X, pady=(0, 10))
         
-        Label(color_frame, text="ハイライト色:", font=("Arial", 10)).pack(side=tk.LEFT, padx=(0, 10))
+        Label(color_frame, text="ハイライト色:", font=_shared_font(color_frame, 10)).pack(side=tk.LEFT, padx=(0, 10))
         
         self.color_var = StringVar(value=self.initial_color)
         self.color_preview = Frame(color_frame, bg=self.initial_color, width=30, height=20)
@@ -519,7 +928,9 @@ class DataHighlightDialog:
         
         self.color_entry = Entry(color_frame, textvariable=self.color_var, width=10)
         self.color_entry.pack(side=tk.LEFT, padx=(0, 10))
-        self.color_var.trace_add("write", self._update_color_preview)
+        # 入力確定時のみプレビューを更新（入力途中の不完全な値は反映しない）
+        self.color_entry.bind("<FocusOut>", self._update_color_preview)
+        self.color_entry.bind("<Return>", self._update_color_preview)
         
         self.color_btn = Button(color_frame, text="色を選択", command=self._choose_color)
         self.color_btn.pack(side=tk.LEFT)
@@ -528,7 +939,7 @@ class DataHighlightDialog:
         values_frame = Frame(main_frame)
         values_frame.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
         
-        Label(values_frame, text="ハイライト対象の値（1行に1つ）:", font=("Arial", 10)).pack(anchor=tk.W, pady=(0, 5))
+        Label(values_frame, text="ハイライト対象の値（1行に1つ）:", font=_shared_font(values_frame, 10)).pack(anchor=tk.W, pady=(0, 5))
         
         # 値リスト
         self.values_text = tk.Text(values_frame, wrap=tk.WORD, height=12)
@@ -559,30 +970,20 @@ class DataHighlightDialog:
     def _center_dialog(self):
         """ダイアログを親ウィンドウの中央に配置"""
         self.dialog.update_idletasks()
-        
-        # 親ウィンドウの位置とサイズを取得
-        parent_x = self.parent.winfo_rootx()
-        parent_y = self.parent.winfo_rooty()
-        parent_width = self.parent.winfo_width()
-        parent_height = self.parent.winfo_height()
-        
-        # ダイアログのサイズを取得
         dialog_width = self.dialog.winfo_reqwidth()
         dialog_height = self.dialog.winfo_reqheight()
         
-        # 中央の座標を計算
-        x = parent_x + (parent_width - dialog_width) // 2
-        y = parent_y + (parent_height - dialog_height) // 2
-        
-        self.dialog.geometry(f"+{x}+{y}")
+        self.dialog.geometry(_centered_geometry(self.parent, dialog_width, dialog_height))
     
     def _update_color_preview(self, *args):
         """カラープレビューを更新"""
+        color = self.color_var.get()
+        if not _COLOR_RE.match(color):
+            # 無効な色の場合は無視
+            return
         try:
-            color = self.color_var.get()
             self.color_preview.config(bg=color)
-        except:
-            # 無効な色の場合は無視
+        except tk.TclError:
             pass
     
     def _choose_color(self):
@@ -591,12 +992,13 @@ class DataHighlightDialog:
         color = colorchooser.askcolor(initialcolor=self.color_var.get())
         if color[1]:  # color[1]はHEX値
             self.color_var.set(color[1])
+            self._update_color_preview()
     
     def _apply(self):
         """設定を適用"""
         # 値のリストを取得
-        values_text = self.values_text.get("1.0", tk.END).strip()
-        values = [v.strip() for v in values_text.split("\n") if v.strip()]
+        values_text = self.values_text.get("1.0", tk.END)
+        values = [v for v in map(str.strip, values_text.splitlines()) if v]
         
         self.result = {
             'color': self.color_var.get(),